@@ -1,15 +1,25 @@
 # main.py
 import uvicorn
 from fastapi import FastAPI
-from pydantic import BaseModel
-from dotenv import load_dotenv
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel, Field
 import uuid
+from collections import OrderedDict
+from contextlib import aclosing
+from functools import lru_cache
 from google.adk.runners import InMemoryRunner
 from google.genai import types as genai_types
 import asyncio
+import logging
 
-# Carrega as variáveis de ambiente do arquivo .env
-load_dotenv()
+# Configura o logging da aplicação uma única vez, no ponto de entrada. Fica no nível do
+# módulo para valer também com `uvicorn main:app` e em cada worker, que importam este
+# arquivo sem executar o bloco `__main__`. Inclui o registro de auditoria dos guardrails.
+logging.basicConfig(level=logging.INFO)
+
+# Carrega as variáveis de ambiente do arquivo .env uma única vez por processo.
+# `src.config` é o único ponto que chama `load_dotenv()`.
+from src import config
 
 # Importa o seu agente principal
 from src.agents.agent import root_agent
@@ -19,12 +29,39 @@ class ConverseRequest(BaseModel):
     """Define o corpo da requisição para o endpoint de conversa."""
     message: str
     session_id: str | None = None
+    stream: bool = False
 
 class ConverseResponse(BaseModel):
     """Define o corpo da resposta do endpoint de conversa."""
     response: str
     session_id: str
 
+# Limites do endpoint de conversa em lote
+MAX_BATCH_MESSAGES = 100
+MAX_BATCH_CONCURRENCY = 20
+
+class ConverseBatchRequest(BaseModel):
+    """Define o corpo da requisição para o endpoint de conversa em lote."""
+    messages: list[str] = Field(max_length=MAX_BATCH_MESSAGES)
+    max_concurrency: int = Field(default=10, ge=1, le=MAX_BATCH_CONCURRENCY)
+
+class ConverseBatchItem(BaseModel):
+    """Resultado de uma única mensagem processada em lote."""
+    input: str
+    response: str | None = None
+    error: str | None = None
+
+class ConverseBatchResponse(BaseModel):
+    """Define o corpo da resposta do endpoint de conversa em lote."""
+    results: list[ConverseBatchItem]
+
+class HealthResponse(BaseModel):
+    """Define o corpo da resposta do endpoint de verificação de saúde."""
+    message: str
+
+# Resposta fixa do endpoint de verificação de saúde, montada uma única vez.
+_HEALTH_RESPONSE = HealthResponse(message="Jira Agent API está online. Use o endpoint /converse para interagir.")
+
 # --- Criação da Aplicação FastAPI ---
 app = FastAPI(
     title="Jira Agent API",
@@ -33,40 +70,165 @@ app = FastAPI(
 )
 
 # --- Configuração do Runner ---
-runner = InMemoryRunner(agent=root_agent)
+@lru_cache(maxsize=1)
+def _get_runner() -> InMemoryRunner:
+    """Cria o runner do agente na primeira requisição e o reaproveita nas seguintes."""
+    return InMemoryRunner(agent=root_agent)
+
+# --- Cache de Sessões (LRU) ---
+# O InMemoryRunner guarda todas as sessões indefinidamente. Mantemos apenas as
+# MAX_ACTIVE_SESSIONS mais recentes e removemos as mais antigas do serviço de sessões.
+MAX_ACTIVE_SESSIONS = 1024
+_active_sessions: OrderedDict[tuple[str, str], None] = OrderedDict()
+_sessions_lock = asyncio.Lock()
+
+async def _ensure_session(user_id: str, session_id: str) -> None:
+    """Garante que a sessão exista no runner, reaproveitando-a se já estiver em cache."""
+    key = (user_id, session_id)
+    async with _sessions_lock:
+        if key in _active_sessions:
+            _active_sessions.move_to_end(key)
+            return
+
+        runner = _get_runner()
+        session_service = runner.session_service
+        session = await session_service.get_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+        if session is None:
+            await session_service.create_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id
+            )
+        _active_sessions[key] = None
+
+        if len(_active_sessions) > MAX_ACTIVE_SESSIONS:
+            (old_user_id, old_session_id), _ = _active_sessions.popitem(last=False)
+            await session_service.delete_session(
+                app_name=runner.app_name, user_id=old_user_id, session_id=old_session_id
+            )
+
+async def _iter_agent_events(message: str, session_id: str, user_id: str = "user"):
+    """
+    Executa um turno do agente sem bloquear o event loop, produzindo os eventos à medida que chegam.
+
+    A sessão já deve existir no serviço de sessões do runner.
+    """
+    # Converte a mensagem de string para o formato esperado pelo ADK
+    new_message = genai_types.Content(role="user", parts=[genai_types.Part(text=message)])
+
+    # aclosing fecha o gerador do ADK assim que este for fechado, na mesma task,
+    # em vez de deixar a limpeza do turno para o finalizador do coletor de lixo
+    async with aclosing(_get_runner().run_async(
+        user_id=user_id,
+        session_id=session_id,
+        new_message=new_message,
+    )) as events:
+        async for event in events:
+            yield event
+
+async def _run_agent_turn(message: str, session_id: str, user_id: str = "user") -> str:
+    """Executa um turno do agente e retorna apenas a resposta final."""
+    async with aclosing(_iter_agent_events(message, session_id, user_id)) as events:
+        async for event in events:
+            # Encerra assim que a resposta final chega, sem drenar o restante do gerador
+            if event.is_final_response():
+                if event.content and event.content.parts:
+                    return event.content.parts[0].text or ""
+                break
+
+    return ""
+
+def _format_sse(text: str) -> str:
+    """Formata um texto (possivelmente com várias linhas) como um evento Server-Sent Events."""
+    return "".join(f"data: {line}\n" for line in text.split("\n")) + "\n"
+
+async def _stream_agent_turn(message: str, session_id: str, user_id: str = "user"):
+    """Produz, no formato SSE, cada texto gerado pelo agente assim que ele fica disponível."""
+    async with aclosing(_iter_agent_events(message, session_id, user_id)) as events:
+        async for event in events:
+            if event.content and event.content.parts:
+                text = "".join(part.text for part in event.content.parts if part.text)
+                if text:
+                    yield _format_sse(text)
+            if event.is_final_response():
+                break
 
 @app.post("/converse", response_model=ConverseResponse, summary="Endpoint de Conversa com o Agente")
 async def converse(request: ConverseRequest):
     """
     Envia uma mensagem para o agente e recebe sua resposta.
     Gerencia a sessão de forma automática.
+
+    Com `stream=True`, a resposta é enviada como `text/event-stream` à medida que o
+    agente gera o texto, e o ID da sessão é devolvido no cabeçalho `X-Session-Id`.
     """
-    session_id = request.session_id or str(uuid.uuid4())
+    session_id = request.session_id or uuid.uuid4().hex
     user_id = "user"  # Pode ser um ID de usuário fixo ou dinâmico
+    await _ensure_session(user_id, session_id)
 
-    # Converte a mensagem de string para o formato esperado pelo ADK
-    new_message = genai_types.Content(parts=[genai_types.Part(text=request.message)])
+    if request.stream:
+        return StreamingResponse(
+            _stream_agent_turn(request.message, session_id, user_id=user_id),
+            media_type="text/event-stream",
+            headers={"X-Session-Id": session_id},
+        )
 
-    # Executa o agente de forma assíncrona
-    events_generator = runner.run(
-        user_id=user_id,
-        session_id=session_id,
-        new_message=new_message,
-    )
+    # Executa o agente de forma assíncrona, liberando o event loop entre os eventos
+    final_response = await _run_agent_turn(request.message, session_id, user_id=user_id)
 
-    final_response = ""
-    for event in events_generator:
-        if event.type == "model_response":
-            final_response = event.content.parts[0].text
+    # Serializa o modelo diretamente: devolver um `Response` evita que o FastAPI valide de novo a saída
+    body = ConverseResponse(response=final_response, session_id=session_id).model_dump_json()
+    return Response(content=body, media_type="application/json")
 
-    return ConverseResponse(response=final_response, session_id=session_id)
+@app.post("/converse/batch", response_model=ConverseBatchResponse, summary="Endpoint de Conversa em Lote")
+async def converse_batch(request: ConverseBatchRequest):
+    """
+    Envia várias mensagens independentes ao agente de uma só vez.
+    Cada mensagem recebe sua própria sessão temporária e as execuções ocorrem em paralelo,
+    limitadas por `max_concurrency`. A falha de uma mensagem é informada no campo `error`
+    do seu item, sem interromper as demais.
+    """
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+    runner = _get_runner()
+    session_service = runner.session_service
+    user_id = "user"
+
+    async def _one(message: str) -> ConverseBatchItem:
+        # As sessões do lote são descartáveis: não passam pelo cache LRU, para não
+        # expulsar as sessões das conversas interativas, e são removidas ao final do turno.
+        session_id = uuid.uuid4().hex
+        async with semaphore:
+            try:
+                await session_service.create_session(
+                    app_name=runner.app_name, user_id=user_id, session_id=session_id
+                )
+                response = await _run_agent_turn(message, session_id, user_id=user_id)
+            except Exception as e:
+                # Exceções sem mensagem (ex: asyncio.TimeoutError()) ainda precisam de um `error` não vazio
+                return ConverseBatchItem(input=message, error=str(e) or type(e).__name__)
+            finally:
+                await session_service.delete_session(
+                    app_name=runner.app_name, user_id=user_id, session_id=session_id
+                )
+        return ConverseBatchItem(input=message, response=response)
 
-@app.get("/", summary="Endpoint de Verificação de Saúde")
+    results = await asyncio.gather(*[_one(m) for m in request.messages])
+    return ConverseBatchResponse(results=list(results))
+
+@app.get("/", response_model=HealthResponse, summary="Endpoint de Verificação de Saúde")
 async def root():
     """Verifica se o servidor está online."""
-    return {"message": "Jira Agent API está online. Use o endpoint /converse para interagir."}
+    return _HEALTH_RESPONSE
 
 # --- Ponto de Entrada para Execução ---
 if __name__ == "__main__":
-    # Executa o servidor com uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8003)
+    # O uvicorn escolhe sozinho uvloop e httptools quando estão instalados (via uvicorn[standard]),
+    # e volta para asyncio/h11 onde não estão disponíveis (ex: uvloop no Windows).
+    # Com mais de um worker o uvicorn exige a aplicação como string de importação.
+    # Observação: `workers` não é compatível com `--reload`.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8003,
+        workers=config.API_WORKERS,
+    )
@@ -4,8 +4,10 @@ from google.adk.tools.tool_context import ToolContext
 from typing import Optional, Dict, Any
 import logging
 
-# Configura o logging para exibir informações de debug
-logging.basicConfig(level=logging.INFO)
+# Logger do módulo. A configuração de handlers e níveis fica a cargo da aplicação;
+# o NullHandler evita avisos quando nenhum handler foi configurado.
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 def before_tool_callback_handler(
     tool: BaseTool,
@@ -37,17 +39,19 @@ def before_tool_callback_handler(
     agent_name = tool_context.agent_name
     tool_name = tool.name
     
-    logging.info(
-        f"[GUARDRAIL] Agente '{agent_name}' vai executar a ferramenta '{tool_name}' "
-        f"com os seguintes argumentos: {args}"
-    )
+    # Formatação preguiçosa: a mensagem só é montada se o nível INFO estiver habilitado
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "[GUARDRAIL] Agente '%s' vai executar a ferramenta '%s' com os seguintes argumentos: %s",
+            agent_name, tool_name, args,
+        )
 
     # --- Ponto de Extensão para Validações Futuras ---
     # Exemplo: Bloquear uma ferramenta específica se um argumento for inválido.
     #
     # if tool_name == "minha_ferramenta_critica":
     #     if "parametro_sensivel" in args and args["parametro_sensivel"] == "valor_proibido":
-    #         logging.warning(f"[GUARDRAIL] Bloqueando a execução da ferramenta '{tool_name}' devido a argumento inválido.")
+    #         logger.warning("[GUARDRAIL] Bloqueando a execução da ferramenta '%s' devido a argumento inválido.", tool_name)
     #         return {
     #             "status": "error",
     #             "error_message": "A execução foi bloqueada pela política de segurança."
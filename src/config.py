@@ -16,6 +16,11 @@ GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
 GOOGLE_GENAI_USE_VERTEXAI = os.getenv("GOOGLE_GENAI_USE_VERTEXAI", "FALSE")
 GOOGLE_MODEL = os.getenv("GOOGLE_MODEL", "gemini-2.0-flash")  # Valor padrão se não especificado
 
+# --- Configuração do Servidor da API ---
+# Número de processos do uvicorn. Cada worker tem seu próprio InMemoryRunner, portanto
+# sessões não são compartilhadas entre eles; use valores > 1 apenas com afinidade de sessão.
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
+
 # Verificação para garantir que todas as variáveis necessárias foram carregadas
 if not all([JIRA_SERVER, JIRA_USERNAME, JIRA_API_TOKEN]):
     raise ValueError(
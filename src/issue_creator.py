@@ -1,5 +1,3 @@
 # Agente Especialista em Criar Issues do Jira
-from .agents.issue_creator_agent import issue_creator_agent
-
-# O ADK procura por uma variável chamada 'root_agent'
-root_agent = issue_creator_agent 
\ No newline at end of file
+# As ferramentas de criação fazem parte do agente central; reexportamos a mesma instância.
+from .agents.agent import root_agent
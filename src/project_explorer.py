@@ -1,5 +1,3 @@
 # Agente Especialista em Explorar Projetos do Jira
-from .agents.project_explorer_agent import project_explorer_agent
-
-# O ADK procura por uma variável chamada 'root_agent'
-root_agent = project_explorer_agent 
\ No newline at end of file
+# As ferramentas de exploração fazem parte do agente central; reexportamos a mesma instância.
+from .agents.agent import root_agent
@@ -18,6 +18,15 @@ class BatchCreateIssuesInput(BaseModel):
     """Define a lista de issues para a ferramenta de criação em lote."""
     issues_to_create: List[IssueToCreate] = Field(description="Uma lista de issues a serem criadas, cada uma com seus próprios detalhes.")
 
+# Quantidade máxima de issues aceitas pelo Jira em uma única chamada a /issue/bulk
+BULK_CREATE_CHUNK_SIZE = 50
+
+def _format_bulk_error(error) -> str:
+    """Converte o erro retornado pelo /issue/bulk (um dicionário por campo) em texto."""
+    if isinstance(error, dict):
+        return "; ".join(f"{field}: {message}" for field, message in error.items())
+    return str(error)
+
 def batch_create_issues_func(tool_input: BatchCreateIssuesInput) -> str:
     """
     Cria um lote de issues no Jira. Ideal para criar múltiplas tarefas de uma só vez.
@@ -25,16 +34,19 @@ def batch_create_issues_func(tool_input: BatchCreateIssuesInput) -> str:
     """
     try:
         jira_client = utils.get_jira_client()
-        report = []
 
         if not tool_input.issues_to_create:
             return "Nenhum item para processar. Forneça uma lista de issues em 'issues_to_create'."
 
-        for issue_data in tool_input.issues_to_create:
+        # Mantém o relatório na mesma ordem das issues recebidas
+        report = [None] * len(tool_input.issues_to_create)
+        pending = []  # (posição no relatório, dados da issue, dicionário de criação)
+
+        for position, issue_data in enumerate(tool_input.issues_to_create):
             # Valida o projeto
             project_key, error_message = utils.validate_project_access(jira_client, issue_data.project_name_or_key)
             if error_message:
-                report.append(f"❌ Falha para '{issue_data.summary}': {error_message}")
+                report[position] = f"❌ Falha para '{issue_data.summary}': {error_message}"
                 continue
 
             # Monta o dicionário para criação
@@ -48,34 +60,51 @@ def batch_create_issues_func(tool_input: BatchCreateIssuesInput) -> str:
             if issue_data.original_estimate:
                 issue_dict["timetracking"] = {"originalEstimate": issue_data.original_estimate}
 
-            try:
-                new_issue = jira_client.create_issue(fields=issue_dict)
-                creation_message = f"Issue '{new_issue.key}' criada."
+            pending.append((position, issue_data, issue_dict))
 
-                if issue_data.time_spent and issue_data.work_start_date:
-                    if not utils.is_valid_date(issue_data.work_start_date):
-                        report.append(f"⚠️ Alerta: {creation_message} Mas falhou ao registrar tempo: 'work_start_date' deve estar no formato YYYY-MM-DD.")
-                        continue
-
-                    log_success, log_message = utils.log_work_for_issue(
-                        jira_client=jira_client,
-                        issue_key=new_issue.key,
-                        time_spent=issue_data.time_spent,
-                        work_start_date=issue_data.work_start_date,
-                        work_description=issue_data.description
-                    )
-                    if log_success:
-                        report.append(f"✅ Sucesso: {creation_message} {log_message}")
-                    else:
-                        report.append(f"⚠️ Alerta: {creation_message} Mas falhou ao registrar tempo: {log_message}")
-                else:
-                    report.append(f"✅ Sucesso: {creation_message}")
+        # Cria as issues em blocos via /issue/bulk: uma requisição a cada BULK_CREATE_CHUNK_SIZE issues
+        for start in range(0, len(pending), BULK_CREATE_CHUNK_SIZE):
+            chunk = pending[start:start + BULK_CREATE_CHUNK_SIZE]
 
+            try:
+                results = jira_client.create_issues(field_list=[issue_dict for _, _, issue_dict in chunk], prefetch=False)
             except JIRAError as e:
                 error_text = e.text if e.text else "Nenhuma mensagem de erro detalhada recebida."
-                report.append(f"❌ Falha ao criar issue '{issue_data.summary}': {e.status_code} - {error_text}")
+                for position, issue_data, _ in chunk:
+                    report[position] = f"❌ Falha ao criar issue '{issue_data.summary}': {e.status_code} - {error_text}"
+                continue
             except Exception as e:
-                report.append(f"❌ Falha ao criar issue '{issue_data.summary}': {e}")
+                for position, issue_data, _ in chunk:
+                    report[position] = f"❌ Falha ao criar issue '{issue_data.summary}': {e}"
+                continue
+
+            for (position, issue_data, _), result in zip(chunk, results):
+                if result["status"] != "Success":
+                    report[position] = f"❌ Falha ao criar issue '{issue_data.summary}': {_format_bulk_error(result['error'])}"
+                    continue
+
+                new_issue = result["issue"]
+                creation_message = f"Issue '{new_issue.key}' criada."
+
+                if not (issue_data.time_spent and issue_data.work_start_date):
+                    report[position] = f"✅ Sucesso: {creation_message}"
+                    continue
+
+                if not utils.is_valid_date(issue_data.work_start_date):
+                    report[position] = f"⚠️ Alerta: {creation_message} Mas falhou ao registrar tempo: 'work_start_date' deve estar no formato YYYY-MM-DD."
+                    continue
+
+                log_success, log_message = utils.log_work_for_issue(
+                    jira_client=jira_client,
+                    issue_key=new_issue.key,
+                    time_spent=issue_data.time_spent,
+                    work_start_date=issue_data.work_start_date,
+                    work_description=issue_data.description
+                )
+                if log_success:
+                    report[position] = f"✅ Sucesso: {creation_message} {log_message}"
+                else:
+                    report[position] = f"⚠️ Alerta: {creation_message} Mas falhou ao registrar tempo: {log_message}"
         
         return "\n".join(report)
 
@@ -1,5 +1,5 @@
 from jira import JIRAError
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pydantic import BaseModel, Field
 from google.adk.tools import FunctionTool
 from src import config
@@ -27,23 +27,31 @@ def create_issue_func(tool_input: CreateIssueInput) -> str:
     try:
         jira_client = utils.get_jira_client()
         
-        project_key, error_message = utils.validate_project_access(jira_client, tool_input.project_name_or_key)
-        if error_message:
-            return f"❌ {error_message}"
+        # A resolução do projeto e a busca do responsável são independentes: executa as duas em paralelo
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(utils.validate_project_access, jira_client, tool_input.project_name_or_key)
+            account_future = (
+                executor.submit(utils.get_user_account_id_by_email, jira_client, config.JIRA_USERNAME)
+                if config.JIRA_USERNAME else None
+            )
 
-        issue_dict = {
-            "project": {"key": project_key},
-            "summary": tool_input.summary,
-            "description": tool_input.description,
-            "issuetype": {"name": tool_input.issuetype},
-        }
-        
-        if config.JIRA_USERNAME:
-            account_id, error_message = utils.get_user_account_id_by_email(jira_client, config.JIRA_USERNAME)
+            project_key, error_message = project_future.result()
             if error_message:
-                print(f"⚠️ Aviso: Não foi possível atribuir a issue. Motivo: {error_message}")
-            elif account_id:
-                issue_dict["assignee"] = {"accountId": account_id}
+                return f"❌ {error_message}"
+
+            issue_dict = {
+                "project": {"key": project_key},
+                "summary": tool_input.summary,
+                "description": tool_input.description,
+                "issuetype": {"name": tool_input.issuetype},
+            }
+
+            if account_future:
+                account_id, error_message = account_future.result()
+                if error_message:
+                    print(f"⚠️ Aviso: Não foi possível atribuir a issue. Motivo: {error_message}")
+                elif account_id:
+                    issue_dict["assignee"] = {"accountId": account_id}
 
         if tool_input.original_estimate or tool_input.remaining_estimate:
             issue_dict["timetracking"] = {}
@@ -55,10 +63,10 @@ def create_issue_func(tool_input: CreateIssueInput) -> str:
         new_issue = jira_client.create_issue(fields=issue_dict)
         
         if tool_input.time_spent:
-            if not tool_input.work_start_date or not utils.is_valid_date(tool_input.work_start_date):
+            work_datetime = utils.parse_iso_date(tool_input.work_start_date)
+            if not work_datetime:
                  return f"❌ Erro: 'work_start_date' é obrigatório e deve estar no formato YYYY-MM-DD ao informar 'time_spent'."
             
-            work_datetime = datetime.strptime(tool_input.work_start_date, '%Y-%m-%d')
             jira_client.add_worklog(new_issue.key, timeSpent=tool_input.time_spent, started=work_datetime)
         
         return f"✅ Issue {new_issue.key} criada com sucesso! URL: {new_issue.permalink()}"
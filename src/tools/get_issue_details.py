@@ -3,6 +3,9 @@ from google.adk.tools import FunctionTool
 from datetime import datetime
 from src import utils
 
+# Campos da issue exibidos por esta ferramenta
+ISSUE_DETAIL_FIELDS = "summary,issuetype,status,priority,assignee,creator,created,updated,resolutiondate,timetracking,description"
+
 class GetIssueDetailsInput(BaseModel):
     """Define os argumentos para a ferramenta de busca de detalhes de issue."""
     project_identifier: str = Field(description="O nome ou chave do projeto onde a issue está.")
@@ -24,7 +27,7 @@ def get_issue_details_func(tool_input: GetIssueDetailsInput) -> str:
         if error_message:
             return f"❌ {error_message}"
         
-        issue = jira_client.issue(issue_key, expand='changelog')
+        issue = jira_client.issue(issue_key, fields=ISSUE_DETAIL_FIELDS)
         
         result_lines = []
         result_lines.append(f"📋 Detalhes da Issue: {issue.key}")
@@ -41,21 +44,24 @@ def get_issue_details_func(tool_input: GetIssueDetailsInput) -> str:
         result_lines.append("")
         
         result_lines.append("📅 Datas:")
-        created = datetime.strptime(issue.fields.created[:19], '%Y-%m-%dT%H:%M:%S')
+        created = datetime.fromisoformat(issue.fields.created[:19])
         result_lines.append(f"   • Criada: {created.strftime('%d/%m/%Y às %H:%M')}")
-        updated = datetime.strptime(issue.fields.updated[:19], '%Y-%m-%dT%H:%M:%S')
+        updated = datetime.fromisoformat(issue.fields.updated[:19])
         result_lines.append(f"   • Atualizada: {updated.strftime('%d/%m/%Y às %H:%M')}")
         if issue.fields.resolutiondate:
-            resolved = datetime.strptime(issue.fields.resolutiondate[:19], '%Y-%m-%dT%H:%M:%S')
+            resolved = datetime.fromisoformat(issue.fields.resolutiondate[:19])
             result_lines.append(f"   • Resolvida: {resolved.strftime('%d/%m/%Y às %H:%M')}")
         result_lines.append("")
         
-        if hasattr(issue.fields, 'timetracking') and issue.fields.timetracking:
+        timetracking = getattr(issue.fields, 'timetracking', None)
+        if timetracking:
             result_lines.append("⏱️  Tempo:")
-            timetracking = issue.fields.timetracking
-            if hasattr(timetracking, 'originalEstimate'): result_lines.append(f"   • Estimativa Original: {timetracking.originalEstimate}")
-            if hasattr(timetracking, 'remainingEstimate'): result_lines.append(f"   • Estimativa Restante: {timetracking.remainingEstimate}")
-            if hasattr(timetracking, 'timeSpent'): result_lines.append(f"   • Tempo Gasto: {timetracking.timeSpent}")
+            original_estimate = getattr(timetracking, 'originalEstimate', None)
+            if original_estimate: result_lines.append(f"   • Estimativa Original: {original_estimate}")
+            remaining_estimate = getattr(timetracking, 'remainingEstimate', None)
+            if remaining_estimate: result_lines.append(f"   • Estimativa Restante: {remaining_estimate}")
+            time_spent = getattr(timetracking, 'timeSpent', None)
+            if time_spent: result_lines.append(f"   • Tempo Gasto: {time_spent}")
             result_lines.append("")
         
         if issue.fields.description:
@@ -68,7 +74,7 @@ def get_issue_details_func(tool_input: GetIssueDetailsInput) -> str:
         if worklogs:
             result_lines.append("⏰ Registros de Trabalho (últimos 5):")
             for worklog in worklogs[-5:]:
-                started = datetime.strptime(worklog.started[:19], '%Y-%m-%dT%H:%M:%S')
+                started = datetime.fromisoformat(worklog.started[:19])
                 author = worklog.author.displayName if worklog.author else 'Usuário desconhecido'
                 result_lines.append(f"   • {started.strftime('%d/%m/%Y')} - {worklog.timeSpent} por {author}")
             result_lines.append("")
@@ -6,6 +6,16 @@ class GetIssueTypesInput(BaseModel):
     """Define os argumentos para a ferramenta de busca de tipos de issue."""
     project_name_or_key: str = Field(description="O nome ou chave do projeto para o qual os tipos de issue serão listados.")
 
+@utils.ttl_cache(utils.ISSUE_TYPES_CACHE_TTL)
+def _fetch_issue_types(jira_client, project_key: str) -> list | None:
+    """Busca os tipos de issue do projeto via createmeta. O resultado é reaproveitado por alguns minutos."""
+    createmeta = jira_client.createmeta(projectKeys=project_key, expand="projects.issuetypes")
+    
+    if not createmeta['projects']:
+        return None
+    
+    return createmeta['projects'][0]['issuetypes']
+
 def get_issue_types_func(tool_input: GetIssueTypesInput) -> str:
     """
     Busca os tipos de issues (ex: 'Bug', 'Task', 'Story') disponíveis em um projeto específico.
@@ -18,14 +28,11 @@ def get_issue_types_func(tool_input: GetIssueTypesInput) -> str:
         if error_message:
             return f"❌ {error_message}"
         
-        createmeta = jira_client.createmeta(projectKeys=project_key, expand="projects.issuetypes")
+        available_types = _fetch_issue_types(jira_client, project_key)
         
-        if not createmeta['projects']:
+        if available_types is None:
             return f"Não foi possível obter tipos de issues para o projeto '{tool_input.project_name_or_key}'."
         
-        project_data = createmeta['projects'][0]
-        available_types = project_data['issuetypes']
-        
         result = [f"Tipos de Issues disponíveis no projeto {tool_input.project_name_or_key} (Chave: {project_key}):", ""]
         for issue_type in available_types:
             result.append(f"• {issue_type['name']} - {issue_type.get('description', 'Sem descrição')}")
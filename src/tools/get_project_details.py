@@ -6,11 +6,38 @@ class GetProjectDetailsInput(BaseModel):
     """Define os argumentos para a ferramenta de busca de detalhes de projeto."""
     project_name_or_key: str = Field(description="A chave ('PROJ') ou o nome ('Meu Projeto') do projeto a ser detalhado.")
 
-def get_project_details_func(tool_input: GetProjectDetailsInput) -> str:
-    """
-    Obtém detalhes específicos de um projeto do Jira, como descrição, líder e componentes.
-    Use esta ferramenta quando precisar de informações aprofundadas sobre um projeto específico.
-    """
+@utils.ttl_cache(utils.PROJECTS_CACHE_TTL)
+def _fetch_project_details(jira_client, project_key: str) -> str:
+    """Monta o texto de detalhes do projeto. O resultado é reaproveitado por alguns segundos."""
+    project = jira_client.project(project_key)
+    
+    result = [
+        f"Detalhes do Projeto: {project.key}",
+        "=" * 50,
+        f"Nome: {project.name}",
+        f"Chave: {project.key}",
+        f"Tipo: {getattr(project, 'projectTypeKey', 'N/A')}",
+    ]
+    
+    description = getattr(project, 'description', None)
+    if description:
+        result.append(f"Descrição: {description}")
+    
+    lead = getattr(project, 'lead', None)
+    if lead:
+        result.append(f"Líder do Projeto: {lead.displayName}")
+    
+    # O recurso do projeto já inclui os componentes, dispensando uma segunda requisição
+    components = getattr(project, 'components', None)
+    if components:
+        result.append("\nComponentes disponíveis:")
+        for component in components:
+            result.append(f"• {component.name}")
+    
+    return "\n".join(result)
+
+def _get_project_details_sync(tool_input: GetProjectDetailsInput) -> str:
+    """Implementação síncrona de `get_project_details_func`, executada fora do event loop."""
     try:
         jira_client = utils.get_jira_client()
         
@@ -19,32 +46,17 @@ def get_project_details_func(tool_input: GetProjectDetailsInput) -> str:
         if error_message:
             return f"❌ {error_message}"
         
-        project = jira_client.project(project_key)
-        
-        result = [
-            f"Detalhes do Projeto: {project.key}",
-            "=" * 50,
-            f"Nome: {project.name}",
-            f"Chave: {project.key}",
-            f"Tipo: {getattr(project, 'projectTypeKey', 'N/A')}",
-        ]
-        
-        if hasattr(project, 'description') and project.description:
-            result.append(f"Descrição: {project.description}")
-        
-        if hasattr(project, 'lead') and project.lead:
-            result.append(f"Líder do Projeto: {project.lead.displayName}")
-        
-        components = jira_client.project_components(project_key)
-        if components:
-            result.append("\nComponentes disponíveis:")
-            for component in components:
-                result.append(f"• {component.name}")
-        
-        return "\n".join(result)
+        return _fetch_project_details(jira_client, project_key)
 
     except Exception as e:
         return f"Erro ao buscar detalhes do projeto '{tool_input.project_name_or_key}': {e}"
 
+async def get_project_details_func(tool_input: GetProjectDetailsInput) -> str:
+    """
+    Obtém detalhes específicos de um projeto do Jira, como descrição, líder e componentes.
+    Use esta ferramenta quando precisar de informações aprofundadas sobre um projeto específico.
+    """
+    return await utils.run_blocking(_get_project_details_sync, tool_input)
+
 get_project_details = FunctionTool(get_project_details_func)
 get_project_details.name = "get_project_details" 
\ No newline at end of file
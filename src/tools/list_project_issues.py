@@ -3,10 +3,28 @@ Lista todas as issues de um projeto específico com filtros opcionais.
 """
 
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from utils import get_jira_client, validate_project_access
+from src.utils import get_jira_client, validate_project_access
+
+# Campos retornados pelo Jira para cada issue listada
+ISSUE_LIST_FIELDS = "summary,status,issuetype,priority,assignee,created,updated"
+
+
+def _issue_to_dict(issue) -> dict:
+    """Converte uma issue retornada pela busca no dicionário exibido na listagem."""
+    fields = issue.fields
+    priority = fields.priority
+    assignee = fields.assignee
+    return {
+        "key": issue.key,
+        "summary": fields.summary,
+        "status": fields.status.name,
+        "type": fields.issuetype.name,
+        "priority": priority.name if priority else "Sem prioridade",
+        "assignee": assignee.displayName if assignee else "Não atribuído",
+        "created": fields.created,
+        "updated": fields.updated
+    }
 
 
 def list_project_issues(project_identifier: str, status_filter: str = None, name_filter: str = None):
@@ -40,26 +58,14 @@ def list_project_issues(project_identifier: str, status_filter: str = None, name
         
         jql = " AND ".join(jql_parts) + " ORDER BY created DESC"
         
-        # Busca as issues
-        issues = jira.search_issues(jql, maxResults=100, expand='changelog')
+        # Busca as issues, trazendo apenas os campos exibidos
+        issues = jira.search_issues(jql, maxResults=100, fields=ISSUE_LIST_FIELDS)
         
         if not issues:
             return {"message": f"Nenhuma issue encontrada no projeto '{project_key}' com os filtros aplicados."}
         
         # Formata os resultados
-        results = []
-        for issue in issues:
-            issue_info = {
-                "key": issue.key,
-                "summary": issue.fields.summary,
-                "status": issue.fields.status.name,
-                "type": issue.fields.issuetype.name,
-                "priority": issue.fields.priority.name if issue.fields.priority else "Sem prioridade",
-                "assignee": issue.fields.assignee.displayName if issue.fields.assignee else "Não atribuído",
-                "created": issue.fields.created,
-                "updated": issue.fields.updated
-            }
-            results.append(issue_info)
+        results = [_issue_to_dict(issue) for issue in issues]
         
         return {
             "project_key": project_key,
@@ -77,8 +83,8 @@ def list_project_issues(project_identifier: str, status_filter: str = None, name
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Uso: python list_project_issues.py <projeto> [status] [nome]")
-        print("Exemplo: python list_project_issues.py 'PROJ' 'Done' 'bug'")
+        print("Uso: python -m src.tools.list_project_issues <projeto> [status] [nome]")
+        print("Exemplo: python -m src.tools.list_project_issues 'PROJ' 'Done' 'bug'")
         sys.exit(1)
     
     project = sys.argv[1]
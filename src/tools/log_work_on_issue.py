@@ -1,6 +1,5 @@
 from pydantic import BaseModel, Field
 from google.adk.tools import FunctionTool
-import dateparser
 from src import utils
 
 class LogWorkInput(BaseModel):
@@ -11,11 +10,8 @@ class LogWorkInput(BaseModel):
     work_start_date: str = Field(description="A data em que o trabalho foi realizado. Formatos flexíveis são aceitos (ex: 'hoje', 'ontem', '25/12/2023').")
     work_description: str = Field(default="", description="Uma descrição ou comentário opcional sobre o trabalho realizado.")
 
-def log_work_on_issue_func(tool_input: LogWorkInput) -> str:
-    """
-    Registra o tempo trabalhado em uma issue existente, buscando o projeto e a issue de forma inteligente.
-    Use esta ferramenta para adicionar um registro de trabalho (worklog) a uma tarefa específica.
-    """
+def _log_work_on_issue_sync(tool_input: LogWorkInput) -> str:
+    """Implementação síncrona de `log_work_on_issue_func`, executada fora do event loop."""
     try:
         jira_client = utils.get_jira_client()
         
@@ -27,7 +23,7 @@ def log_work_on_issue_func(tool_input: LogWorkInput) -> str:
         if error_message:
             return f"❌ {error_message}"
         
-        work_datetime = dateparser.parse(tool_input.work_start_date, languages=['pt'], settings={'PREFER_DATES_FROM': 'past', 'DATE_ORDER': 'DMY'})
+        work_datetime = utils.parse_work_date(tool_input.work_start_date)
         if not work_datetime:
             return f"❌ Erro: Não foi possível entender a data '{tool_input.work_start_date}'."
 
@@ -44,5 +40,12 @@ def log_work_on_issue_func(tool_input: LogWorkInput) -> str:
     except Exception as e:
         return f"❌ Erro ao registrar trabalho: {e}."
 
+async def log_work_on_issue_func(tool_input: LogWorkInput) -> str:
+    """
+    Registra o tempo trabalhado em uma issue existente, buscando o projeto e a issue de forma inteligente.
+    Use esta ferramenta para adicionar um registro de trabalho (worklog) a uma tarefa específica.
+    """
+    return await utils.run_blocking(_log_work_on_issue_sync, tool_input)
+
 log_work_on_issue = FunctionTool(log_work_on_issue_func)
 log_work_on_issue.name = "log_work_on_issue" 
\ No newline at end of file
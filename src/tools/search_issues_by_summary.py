@@ -7,11 +7,8 @@ class SearchIssuesInput(BaseModel):
     project_identifier: str = Field(description="O nome ou chave do projeto onde a busca será realizada (ex: 'Meu Projeto', 'PROJ').")
     summary: str = Field(description="O título ou parte do título da issue a ser buscada.")
 
-def search_issues_by_summary_func(tool_input: SearchIssuesInput) -> str:
-    """
-    Busca por issues (tarefas) em um projeto específico do Jira pelo seu título (summary).
-    Use esta ferramenta para encontrar tarefas existentes quando você sabe parte do título delas.
-    """
+def _search_issues_by_summary_sync(tool_input: SearchIssuesInput) -> str:
+    """Implementação síncrona de `search_issues_by_summary_func`, executada fora do event loop."""
     try:
         jira_client = utils.get_jira_client()
 
@@ -35,5 +32,12 @@ def search_issues_by_summary_func(tool_input: SearchIssuesInput) -> str:
     except Exception as e:
         return f"❌ Erro ao buscar issues no Jira: {e}"
 
+async def search_issues_by_summary_func(tool_input: SearchIssuesInput) -> str:
+    """
+    Busca por issues (tarefas) em um projeto específico do Jira pelo seu título (summary).
+    Use esta ferramenta para encontrar tarefas existentes quando você sabe parte do título delas.
+    """
+    return await utils.run_blocking(_search_issues_by_summary_sync, tool_input)
+
 search_issues_by_summary = FunctionTool(search_issues_by_summary_func)
 search_issues_by_summary.name = "search_issues_by_summary" 
\ No newline at end of file
@@ -6,45 +6,43 @@ class SearchProjectsInput(BaseModel):
     """Define os argumentos para a ferramenta de busca de projetos."""
     search_term: str = Field(default="", description="Termo para filtrar projetos por nome ou chave. Se vazio, lista todos os projetos visíveis.")
 
-def search_jira_projects_func(tool_input: SearchProjectsInput) -> str:
-    """
-    Busca e lista projetos do Jira. Pode filtrar por um termo de busca ou listar todos os projetos disponíveis.
-    Use esta ferramenta para descobrir projetos ou encontrar a chave de um projeto específico.
-    """
+def _search_jira_projects_sync(tool_input: SearchProjectsInput) -> str:
+    """Implementação síncrona de `search_jira_projects_func`, executada fora do event loop."""
     try:
         jira_client = utils.get_jira_client()
         
-        projects = jira_client.projects()
+        index = utils.get_project_index(jira_client)
+        keys, names, project_types = index["keys"], index["names"], index["project_types"]
         
-        if not projects:
+        if not keys:
             return "Nenhum projeto encontrado no Jira."
         
         search_term = tool_input.search_term
         if search_term:
-            search_term_lower = search_term.lower()
-            filtered_projects = [
-                p for p in projects 
-                if search_term_lower in p.name.lower() or search_term_lower in p.key.lower()
-            ]
-            projects = filtered_projects
+            positions = utils.search_projects(index, search_term)
             
-            if not projects:
+            if not positions:
                 return f"Nenhum projeto encontrado com o termo '{search_term}'."
+            
+            header = f"Projetos encontrados com o termo '{search_term}':"
+        else:
+            positions = range(len(keys))
+            header = f"Todos os projetos disponíveis ({len(keys)} encontrados):"
         
-        result = [
-            f"Projetos encontrados com o termo '{search_term}':" if search_term 
-            else f"Todos os projetos disponíveis ({len(projects)} encontrados):",
-            ""
-        ]
-        
-        for project in projects:
-            project_type = getattr(project, 'projectTypeKey', 'N/A')
-            result.append(f"• {project.key} - {project.name} (Tipo: {project_type})")
-        
-        return "\n".join(result)
+        # Monta a saída em uma única passagem sobre as listas do índice, sem acessar os recursos do Jira
+        lines = [header, ""]
+        lines.extend(f"• {keys[i]} - {names[i]} (Tipo: {project_types[i]})" for i in positions)
+        return "\n".join(lines)
 
     except Exception as e:
         return f"Erro ao buscar projetos no Jira: {e}"
 
+async def search_jira_projects_func(tool_input: SearchProjectsInput) -> str:
+    """
+    Busca e lista projetos do Jira. Pode filtrar por um termo de busca ou listar todos os projetos disponíveis.
+    Use esta ferramenta para descobrir projetos ou encontrar a chave de um projeto específico.
+    """
+    return await utils.run_blocking(_search_jira_projects_sync, tool_input)
+
 search_jira_projects = FunctionTool(search_jira_projects_func)
 search_jira_projects.name = "search_jira_projects" 
\ No newline at end of file
@@ -1,3 +1,4 @@
+import json
 from pydantic import BaseModel, Field
 from google.adk.tools import FunctionTool
 from src import utils
@@ -21,20 +22,27 @@ def update_issue_estimates_func(tool_input: UpdateEstimatesInput) -> str:
 
         jira_client = utils.get_jira_client()
         
-        project_key, error_message = utils.validate_project_access(jira_client, tool_input.project_identifier)
-        if error_message:
-            return f"❌ {error_message}"
-
-        issue_key_to_update, error_message = utils.resolve_issue_identifier(jira_client, project_key, tool_input.issue_identifier)
-        if error_message:
-            return f"❌ {error_message}"
+        if utils.is_issue_key(tool_input.issue_identifier):
+            # A chave da issue já identifica o projeto: dispensa a busca do projeto
+            issue_key_to_update = tool_input.issue_identifier.upper()
+        else:
+            project_key, error_message = utils.validate_project_access(jira_client, tool_input.project_identifier)
+            if error_message:
+                return f"❌ {error_message}"
+
+            issue_key_to_update, error_message = utils.resolve_issue_identifier(jira_client, project_key, tool_input.issue_identifier)
+            if error_message:
+                return f"❌ {error_message}"
 
         timetracking_dict = {}
         if tool_input.original_estimate: timetracking_dict["originalEstimate"] = tool_input.original_estimate
         if tool_input.remaining_estimate: timetracking_dict["remainingEstimate"] = tool_input.remaining_estimate
 
-        issue = jira_client.issue(issue_key_to_update)
-        issue.update(fields={"timetracking": timetracking_dict})
+        # Atualiza direto pela chave (PUT), sem buscar a issue antes
+        jira_client._session.put(
+            jira_client._get_url(f"issue/{issue_key_to_update}"),
+            data=json.dumps({"fields": {"timetracking": timetracking_dict}}),
+        )
         
         results = []
         if tool_input.original_estimate: results.append(f"✅ Estimativa Original da issue {issue_key_to_update} atualizada para {tool_input.original_estimate}.")
@@ -1,18 +1,178 @@
 import os
+import asyncio
+import contextvars
 from jira import JIRA, JIRAError
-import dateparser
+from requests.adapters import HTTPAdapter
+from dateparser.date import DateDataParser
 from . import config
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial, wraps
 
+# Tempo (em segundos) durante o qual os dados de projetos do Jira são reaproveitados.
+PROJECTS_CACHE_TTL = 60
+# Tempo (em segundos) durante o qual o índice de projetos usado nas buscas é reaproveitado.
+PROJECT_INDEX_TTL = 300
+# Tempo (em segundos) durante o qual os tipos de issue de cada projeto são reaproveitados.
+ISSUE_TYPES_CACHE_TTL = 300
+# Tempo (em segundos) durante o qual o accountId encontrado para um email é reaproveitado.
+USER_ACCOUNT_CACHE_TTL = 3600
 
+# Data no formato ISO (YYYY-MM-DD), usada com fullmatch. Como no strptime, mês e dia aceitam um dígito.
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# Tamanho do pool de conexões HTTP do cliente JIRA. Deve comportar as chamadas simultâneas
+# feitas pelas ferramentas (JIRA_MAX_CONCURRENCY) e pelos ThreadPoolExecutors.
+JIRA_POOL_SIZE = 32
+
+# Formatos fixos mais comuns, interpretados diretamente antes de recorrer ao dateparser.
+_FAST_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%Y-%m-%dT%H:%M:%S')
+
+# Parser de datas em linguagem natural, construído uma única vez (a construção carrega os locales).
+_work_date_parser = DateDataParser(languages=['pt'], settings={'PREFER_DATES_FROM': 'past', 'DATE_ORDER': 'DMY'})
+
+# Formato de uma chave de projeto do Jira (ex: PROJ)
+_PROJECT_KEY_RE = re.compile(r'^[A-Z][A-Z0-9_]{1,9}$')
+
+# Número máximo de chamadas bloqueantes ao Jira executadas ao mesmo tempo em threads.
+# O limite vem do tamanho de um pool de threads dedicado, que (ao contrário de um
+# asyncio.Semaphore) não fica preso a um event loop específico.
+JIRA_MAX_CONCURRENCY = 8
+_jira_executor = ThreadPoolExecutor(max_workers=JIRA_MAX_CONCURRENCY, thread_name_prefix="jira")
+
+# Índice em memória da lista de projetos. É substituído por inteiro a cada recarga,
+# então leitores concorrentes sempre enxergam uma versão consistente.
+_project_index = {
+    "expires": 0.0, "by_key": {},
+    "keys": [], "names": [], "project_types": [], "keys_lower": [], "names_lower": [], "descriptions_lower": [],
+    "search_memo": {},
+}
+# Quantidade máxima de termos de busca memorizados por versão do índice.
+_SEARCH_MEMO_MAXSIZE = 256
+
+
+@lru_cache(maxsize=1)
 def get_jira_client():
-    """Initializes and returns a JIRA client."""
+    """
+    Initializes and returns a JIRA client.
+
+    The client is created once per process and reused, so its underlying
+    `requests.Session` keeps connections alive across tool calls.
+    """
     jira_client = JIRA(
         server=config.JIRA_SERVER, basic_auth=(config.JIRA_USERNAME, config.JIRA_API_TOKEN)
     )
+
+    # O pool padrão do requests (10 conexões) é pequeno para chamadas simultâneas das ferramentas.
+    # Sem retries no adapter: a ResilientSession do cliente já repete falhas de conexão.
+    adapter = HTTPAdapter(pool_connections=JIRA_POOL_SIZE, pool_maxsize=JIRA_POOL_SIZE)
+    jira_client._session.mount("https://", adapter)
+    jira_client._session.mount("http://", adapter)
     return jira_client
 
+async def run_blocking(func, *args, **kwargs):
+    """
+    Executa uma função síncrona (que usa o cliente JIRA) em uma thread, sem bloquear o event loop.
+
+    No máximo JIRA_MAX_CONCURRENCY chamadas rodam em paralelo; as demais aguardam sua vez.
+    """
+    loop = asyncio.get_running_loop()
+    # Propaga as contextvars para a thread, como asyncio.to_thread faz
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(_jira_executor, partial(context.run, func, *args, **kwargs))
+
+def ttl_cache(ttl_seconds: float, maxsize: int = 256):
+    """
+    Decorador que memoriza o resultado de uma função por `ttl_seconds` segundos.
+
+    A função decorada deve receber o cliente JIRA como primeiro argumento. Ele não entra
+    na chave do cache, pois todas as instâncias apontam para o mesmo servidor e credenciais.
+    Exceções não são armazenadas, então falhas são sempre repetidas na próxima chamada.
+    """
+    def decorator(func):
+        cache = {}
+
+        @wraps(func)
+        def wrapper(jira_client, *args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(jira_client, *args)
+            if len(cache) >= maxsize:
+                cache.pop(next(iter(cache), None), None)
+            cache[args] = (now + ttl_seconds, value)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+def get_project_index(jira_client: JIRA) -> dict:
+    """
+    Retorna o índice de projetos visíveis, recarregando-o do Jira a cada PROJECT_INDEX_TTL segundos.
+
+    O índice contém:
+        - "by_key": dicionário {chave em minúsculas: chave}.
+        - "keys", "names", "project_types", "keys_lower", "names_lower", "descriptions_lower":
+          listas paralelas (uma posição por projeto) com os textos já extraídos dos recursos
+          do Jira e normalizados para as buscas por substring.
+        - "search_memo": resultados de `search_projects` já calculados para esta versão do índice.
+    """
+    global _project_index
+
+    index = _project_index
+    if index["expires"] > time.monotonic():
+        return index
+
+    projects = jira_client.projects()
+    index = {
+        "expires": time.monotonic() + PROJECT_INDEX_TTL,
+        "by_key": {p.key.lower(): p.key for p in projects},
+        "keys": [p.key for p in projects],
+        "names": [p.name for p in projects],
+        "project_types": [getattr(p, 'projectTypeKey', 'N/A') for p in projects],
+        "keys_lower": [p.key.lower() for p in projects],
+        "names_lower": [p.name.lower() for p in projects],
+        "descriptions_lower": [(getattr(p, 'description', None) or "").lower() for p in projects],
+        "search_memo": {},
+    }
+    _project_index = index
+    return index
+
+def search_projects(index: dict, search_term: str) -> list[int]:
+    """
+    Retorna as posições, no índice de projetos, dos projetos cujo nome ou chave contém o termo.
+
+    Recebe o próprio índice obtido com `get_project_index`: as posições só valem para as listas
+    desse mesmo índice, que pode ser substituído por uma recarga a qualquer momento.
+
+    O resultado de cada termo é memorizado no próprio índice e descartado junto com ele na
+    próxima recarga, então buscas repetidas na mesma sessão não refazem a varredura.
+    """
+    search_term_lower = search_term.lower()
+
+    memo = index["search_memo"]
+    found = memo.get(search_term_lower)
+    if found is None:
+        keys_lower = index["keys_lower"]
+        found = [
+            i for i, name_lower in enumerate(index["names_lower"])
+            if search_term_lower in name_lower or search_term_lower in keys_lower[i]
+        ]
+        if len(memo) >= _SEARCH_MEMO_MAXSIZE:
+            memo.clear()
+        memo[search_term_lower] = found
+    return found
+
+@ttl_cache(PROJECTS_CACHE_TTL)
+def _fetch_project_key(jira_client: JIRA, identifier: str) -> str:
+    """Busca um projeto diretamente pela chave e retorna a chave canônica (levanta JIRAError se não existir)."""
+    return jira_client.project(identifier).key
+
 def find_project_by_identifier(jira_client: JIRA, identifier: str) -> tuple[str | None, str | None]:
     """
     Busca um projeto de forma inteligente pelo identificador, procurando na chave, nome e descrição.
@@ -27,31 +187,34 @@ def find_project_by_identifier(jira_client: JIRA, identifier: str) -> tuple[str
         - (None, "mensagem de erro") se nenhum ou múltiplos projetos forem encontrados.
     """
     try:
-        all_projects = jira_client.projects()
+        # Com o índice ainda não carregado, um identificador no formato de chave é buscado
+        # diretamente, evitando baixar a lista completa de projetos
+        if _project_index["expires"] <= time.monotonic() and _PROJECT_KEY_RE.match(identifier):
+            try:
+                return _fetch_project_key(jira_client, identifier), None
+            except JIRAError:
+                pass
+
+        index = get_project_index(jira_client)
         normalized_identifier = identifier.lower()
-        
-        found_projects = []
-        
-        # Itera sobre todos os projetos para encontrar correspondências
-        for project in all_projects:
-            # Verifica a chave, nome e descrição
-            key_match = project.key.lower() == normalized_identifier
-            name_match = normalized_identifier in project.name.lower()
-            
-            description_match = False
-            if hasattr(project, 'description') and project.description:
-                description_match = normalized_identifier in project.description.lower()
-            
-            if key_match or name_match or description_match:
-                found_projects.append(project)
 
-        # Remove duplicatas se um projeto foi encontrado por múltiplos critérios
-        unique_projects = list({p.key: p for p in found_projects}.values())
+        # Correspondência exata com a chave: consulta direta no dicionário
+        project_key = index["by_key"].get(normalized_identifier)
+        if project_key:
+            return project_key, None
 
-        if len(unique_projects) == 1:
-            return unique_projects[0].key, None
-        elif len(unique_projects) > 1:
-            project_list = ", ".join([f"'{p.name}' ({p.key})" for p in unique_projects])
+        # Caso contrário, procura o termo no nome ou na descrição pré-calculados
+        descriptions_lower = index["descriptions_lower"]
+        found = [
+            i for i, name_lower in enumerate(index["names_lower"])
+            if normalized_identifier in name_lower or normalized_identifier in descriptions_lower[i]
+        ]
+
+        keys, names = index["keys"], index["names"]
+        if len(found) == 1:
+            return keys[found[0]], None
+        elif len(found) > 1:
+            project_list = ", ".join([f"'{names[i]}' ({keys[i]})" for i in found])
             return None, f"Ambiguidade encontrada. O termo '{identifier}' corresponde a múltiplos projetos: {project_list}. Por favor, seja mais específico ou use a chave do projeto."
         else:
             return None, f"Nenhum projeto encontrado com o identificador '{identifier}'."
@@ -59,14 +222,50 @@ def find_project_by_identifier(jira_client: JIRA, identifier: str) -> tuple[str
     except Exception as e:
         return None, f"Erro ao buscar projeto no Jira: {e}"
 
+def parse_iso_date(date_string: str) -> datetime | None:
+    """Converte uma data no formato YYYY-MM-DD em datetime, ou retorna None se for inválida."""
+    match = _ISO_DATE_RE.fullmatch(date_string)
+    if not match:
+        return None
+    try:
+        return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+def parse_work_date(date_string: str) -> datetime | None:
+    """
+    Interpreta a data de um registro de trabalho (ex: 'hoje', 'ontem', '25/12/2023').
+
+    Retorna None para strings vazias ou que não puderem ser interpretadas.
+    """
+    date_string = date_string.strip()
+    if not date_string:
+        return None
+    for date_format in _FAST_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_string, date_format)
+        except ValueError:
+            pass
+    # Não há cache aqui: datas relativas ('agora', 'há 2 horas') dependem do instante atual.
+    date_data = _work_date_parser.get_date_data(date_string)
+    return date_data.date_obj if date_data else None
+
 def is_valid_date(date_string: str, format: str = '%Y-%m-%d') -> bool:
     """Verifica se uma string de data corresponde a um formato específico."""
+    if format == '%Y-%m-%d':
+        return parse_iso_date(date_string) is not None
     try:
         datetime.strptime(date_string, format)
         return True
     except ValueError:
         return False
 
+@ttl_cache(USER_ACCOUNT_CACHE_TTL)
+def _search_account_id(jira_client: JIRA, email: str) -> str | None:
+    """Busca no Jira o accountId associado a um email. O resultado é reaproveitado por uma hora."""
+    users = jira_client.search_users(query=email, maxResults=1)
+    return users[0].accountId if users else None
+
 def get_user_account_id_by_email(jira_client: JIRA, email: str) -> tuple[str | None, str | None]:
     """
     Busca o accountId de um usuário no Jira pelo seu email.
@@ -79,9 +278,9 @@ def get_user_account_id_by_email(jira_client: JIRA, email: str) -> tuple[str | N
         Uma tupla (accountId, error_message).
     """
     try:
-        users = jira_client.search_users(query=email, maxResults=1)
-        if users:
-            return users[0].accountId, None
+        account_id = _search_account_id(jira_client, email)
+        if account_id:
+            return account_id, None
         else:
             return None, f"Usuário com email '{email}' não encontrado."
     except JIRAError as e:
@@ -108,7 +307,8 @@ def find_issue_by_summary(jira_client: JIRA, project_key: str, summary: str, fin
     """
     try:
         jql = f'project = "{project_key}" AND summary ~ "{summary}" ORDER BY created DESC'
-        issues = jira_client.search_issues(jql, maxResults=20)
+        # Apenas a chave e o título são usados pelos chamadores
+        issues = jira_client.search_issues(jql, maxResults=20, fields="summary")
 
         if find_one:
             if len(issues) == 1:
@@ -139,7 +339,7 @@ def log_work_for_issue(jira_client: JIRA, issue_key: str, time_spent: str, work_
         Uma tupla (sucesso, mensagem).
     """
     try:
-        work_datetime = dateparser.parse(work_start_date, languages=['pt'], settings={'PREFER_DATES_FROM': 'past', 'DATE_ORDER': 'DMY'})
+        work_datetime = parse_work_date(work_start_date)
         if not work_datetime:
             return False, f"Data '{work_start_date}' inválida."
         
@@ -153,6 +353,17 @@ def log_work_for_issue(jira_client: JIRA, issue_key: str, time_spent: str, work_
     except Exception as e:
         return False, f"Falha ao registrar em '{issue_key}': {e}"
 
+def is_issue_key(identifier: str) -> bool:
+    """Verifica se o identificador tem o formato de uma chave de issue (ex: 'PROJ-123')."""
+    # Equivale a ^[A-Z][A-Z0-9_]*-\d+$ (ignorando maiúsculas/minúsculas), sem passar pelo motor de regex.
+    # O prefixo segue as mesmas regras de caracteres de _PROJECT_KEY_RE (ex: 'AB2-12', 'MY_PROJ-7').
+    prefix, separator, number = identifier.partition('-')
+    return (
+        bool(separator)
+        and prefix.isascii() and prefix[:1].isalpha() and prefix.replace('_', '').isalnum()
+        and number.isascii() and number.isdigit()
+    )
+
 def resolve_issue_identifier(jira_client: JIRA, project_key: str, issue_identifier: str) -> tuple[str | None, str | None]:
     """
     Resolve um identificador de issue, que pode ser uma chave (PROJ-123) ou um nome/título.
@@ -168,7 +379,7 @@ def resolve_issue_identifier(jira_client: JIRA, project_key: str, issue_identifi
         - (None, "mensagem de erro") se houver erro.
     """
     # Se o identificador já é uma chave válida (formato PROJ-123), retorna diretamente
-    if re.match(r'^[A-Z]+-\d+$', issue_identifier.upper()):
+    if is_issue_key(issue_identifier):
         return issue_identifier.upper(), None
     
     # Caso contrário, busca pelo nome/título